@@ -309,6 +309,15 @@ def main():
         cmdclass={
             'build_ext': my_build_ext,
         },
+        options={
+            # Byte-compile the installed modules (plain and -O) so cold
+            # imports hit precompiled .pyc files instead of re-parsing
+            # source, which matters on read-only deployments.
+            'install_lib': {
+                'compile': 1,
+                'optimize': 1,
+            },
+        },
         ext_modules=ext_modules,
         data_files=data_files,
     )
@@ -1,32 +1,7 @@
-# -*- coding: UTF-8 -*-
-#
 # Copyright (c) 2008, Yung-Yu Chen <yyc@solvcon.net>
 #
-# All rights reserved.
-#
-# Redistribution and use in source and binary forms, with or without
-# modification, are permitted provided that the following conditions are met:
-#
-# - Redistributions of source code must retain the above copyright notice, this
-#   list of conditions and the following disclaimer.
-# - Redistributions in binary form must reproduce the above copyright notice,
-#   this list of conditions and the following disclaimer in the documentation
-#   and/or other materials provided with the distribution.
-# - Neither the name of the copyright holder nor the names of its contributors
-#   may be used to endorse or promote products derived from this software
-#   without specific prior written permission.
-#
-# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
-# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
-# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
-# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE
-# LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR
-# CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
-# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
-# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN
-# CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
-# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
-# POSSIBILITY OF SUCH DAMAGE.
+# SPDX-License-Identifier: BSD-3-Clause
+# See COPYING for the full license text.
 
 """
 SOLVCON is a collection of `Python <http://www.python.org>`__-based
@@ -43,7 +18,7 @@ __version__ = '0.1.4.dev0'
 
 __description__ = "SOLVCON: Solvers of conservation laws"
 
-__all__ = [
+__all__ = (
     # module: dependency
     'import_module_may_fail', 'import_name',
     # module: cmdutil
@@ -76,39 +51,124 @@ __all__ = [
     'exception',
     # module: N/A
     'test',
-]
+)
+
+# Names servable from the module, including those not meant for wildcard
+# import; attribute probes outside this set fail fast without touching the
+# lazy import machinery.
+_PUBLIC = frozenset(__all__) | frozenset(['march'])
+
+# Names slated for removal from the package root, mapped to the suggested
+# replacement.  The warning fires on first resolution only, so importing
+# the package stays silent and free of the warnings machinery.
+_DEPRECATED = {
+    'Table': 'use solvcon.march.Table',
+}
+
+import functools
 
-from .dependency import import_module_may_fail, import_name
 from .cmdutil import Command, go
 from .conf import env
-from .block import Block
-import_name('Table', '.march', may_fail=True)
-from .solver import MeshSolver
-from .case import MeshCase
-from .anchor import MeshAnchor, MeshAnchorList
-from .hook import MeshHook
-from .boundcond import BC, bctregy
-from .domain import Domain, Collective, Distributed
-from . import helper
-from .helper import Gmsh
-from . import parcel
-from . import exception
-
-import_module_may_fail('.march')
 
-def test():
+# Outcome of the march import attempt: None means not yet attempted;
+# afterwards it holds the module (or the dummy namespace substituted by
+# dependency._import_libmarch when the extension is not built).
+_march_cache = None
+
+def _load_march():
+    """
+    Import the compiled march extension exactly once; repeated calls,
+    including those after a failed attempt, return the recorded outcome
+    without re-entering the import machinery.
+    """
+    global _march_cache
+    if _march_cache is None:
+        from .dependency import _import_libmarch
+        _march_cache = _import_libmarch()
+    return _march_cache
+
+# Lazily-loaded submodules and public names (PEP 562).  Importing any of
+# these subpackages eagerly makes every ``import solvcon`` pay for the whole
+# solver stack; deferring them to the first attribute access keeps the
+# package import lightweight.
+_lazy_submodules = frozenset(['helper', 'io', 'parcel', 'exception'])
+_lazy_names = {
+    'import_module_may_fail': '.dependency',
+    'import_name': '.dependency',
+    'Block': '.block',
+    'MeshSolver': '.solver',
+    'MeshCase': '.case',
+    'MeshAnchor': '.anchor',
+    'MeshAnchorList': '.anchor',
+    'MeshHook': '.hook',
+    'BC': '.boundcond',
+    'bctregy': '.boundcond',
+    'Domain': '.domain',
+    'Collective': '.domain',
+    'Distributed': '.domain',
+    'Gmsh': '.helper',
+}
+
+def __getattr__(name):
+    """
+    Resolve the lazily-loaded names and cache them in the module namespace
+    so that subsequent accesses are plain dictionary lookups.
+    """
+    import importlib
+    if name not in _PUBLIC:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name))
+    if name in _DEPRECATED:
+        import warnings
+        warnings.warn(
+            "solvcon.%s is deprecated; %s" % (name, _DEPRECATED[name]),
+            DeprecationWarning, stacklevel=2)
+    if name in ('Table', 'march'):
+        march = _load_march()
+        globals()['march'] = march
+        globals()['Table'] = getattr(march, 'Table', None)
+        return globals()[name]
+    if name in _lazy_submodules:
+        mod = importlib.import_module('.' + name, __name__)
+        globals()[name] = mod
+        return mod
+    modname = _lazy_names.get(name)
+    if modname is not None:
+        mod = importlib.import_module(modname, __name__)
+        # Cache the defining submodule as well when it is itself public,
+        # e.g. resolving Gmsh also binds helper.
+        subname = modname.lstrip('.')
+        if subname in _lazy_submodules:
+            globals()[subname] = mod
+        obj = getattr(mod, name)
+        globals()[name] = obj
+        return obj
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+def __dir__():
+    return sorted(_PUBLIC | set(globals()))
+
+@functools.cache
+def _test_paths():
     """
-    Run everything in :py:mod:`solvcon.tests` and :py:mod:`solvcon.io.tests`.
+    Directories scanned by :py:func:`test`, computed once per process.
     """
-    import sys
     import os
-    from nose import run_exit
     from . import tests
     from .io import tests as iotests
-    paths = [os.path.dirname(mod.__file__) for mod in (tests, iotests)]
-    cmds = ['nosetests'] + paths
-    sys.argv = cmds
-    sys.exit(run_exit())
+    return [os.path.dirname(mod.__file__) for mod in (tests, iotests)]
+
+def test():
+    """
+    Run everything in :py:mod:`solvcon.tests` and :py:mod:`solvcon.io.tests`
+    and return the pytest exit code.
+
+    Neither :py:data:`sys.argv` nor the interpreter is touched, so the
+    function can be called repeatedly from one process; callers who want
+    CLI-style termination can wrap it with ``raise SystemExit(test())``.
+    """
+    import pytest
+    return pytest.main(['--no-header'] + _test_paths())
 
 if __name__ == '__main__':
     go()
@@ -0,0 +1,26 @@
+# Static companion to the lazily-loading solvcon/__init__.py; keeps the
+# public names visible to type checkers and IDEs without eager imports.
+
+from . import exception as exception
+from . import helper as helper
+from . import io as io
+from . import parcel as parcel
+from .anchor import MeshAnchor as MeshAnchor
+from .anchor import MeshAnchorList as MeshAnchorList
+from .block import Block as Block
+from .boundcond import BC as BC
+from .boundcond import bctregy as bctregy
+from .case import MeshCase as MeshCase
+from .cmdutil import Command as Command
+from .cmdutil import go as go
+from .conf import env as env
+from .dependency import import_module_may_fail as import_module_may_fail
+from .dependency import import_name as import_name
+from .domain import Collective as Collective
+from .domain import Distributed as Distributed
+from .domain import Domain as Domain
+from .helper import Gmsh as Gmsh
+from .hook import MeshHook as MeshHook
+from .solver import MeshSolver as MeshSolver
+
+def test() -> int: ...
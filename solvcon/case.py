@@ -231,6 +231,20 @@ class MeshHookList(list):
         for hook in runhooks:
             getattr(hook, method)()
 
+    def bind(self, method):
+        """
+        Return the bound methods of every hook for the named event, so hot
+        loops can invoke them without per-call name resolution.
+
+        :param method: name of the method to bind.
+        :type method: str
+        :rtype: tuple
+        """
+        runhooks = self
+        if method == 'postloop':
+            runhooks = reversed(runhooks)
+        return tuple(getattr(hook, method) for hook in runhooks)
+
     def drop_anchor(self, svr):
         for hok in self:
             hok.drop_anchor(svr)
@@ -252,6 +266,9 @@ class MeshCase(case_core.CaseInfo):
         'execution.step_current': None,
         'execution.steps_run': None,
         'execution.steps_stride': 1,
+        # overlap hook execution with remote marching; enable only when no
+        # hook retunes the marching parameters mid-run.
+        'execution.overlap_hooks': False,
         'execution.marchret': None,
         'execution.var': dict,  # for Calculator hooks.
         'execution.varstep': None,  # the step for which var and dvar are valid.
@@ -285,11 +302,10 @@ class MeshCase(case_core.CaseInfo):
     }
 
     def __init__(self, **kw):
-        # populate value from keywords.
-        initpairs = list()
-        for cinfok in self.defdict.keys():
-            lkey = cinfok.split('.')[-1]
-            initpairs.append((cinfok, kw.pop(lkey, None)))
+        # populate value from keywords; the (dotted key, last token) pairs
+        # are precomputed by CaseInfoMeta.
+        initpairs = [(cinfok, kw.pop(lkey, None))
+                     for cinfok, lkey in self._initkeys]
         # initialize with the left keywords.
         super(MeshCase, self).__init__(**kw)
         # populate value from keywords.
@@ -320,13 +336,12 @@ class MeshCase(case_core.CaseInfo):
         tarr = [0,0,0]
         tarr[0] = time.time()
         self.log.time[action] = tarr
-        # header.
-        prefix = info.prefix * (info.width-info.level*info.nchar)
-        info(prefix, travel=1)
-        # content.
-        info('\nStart %s%s%s' % (action, msg, postmsg))
-        prefix = info.prefix * (info.width-info.level*info.nchar)
-        info('\n' + prefix + '\n')
+        # compute both banner widths up front; the trailing banner is one
+        # level deeper because the emitting call travels downward.
+        width = info.width - info.level*info.nchar
+        info('%s\nStart %s%s%s\n%s\n' % (
+            info.prefix * width, action, msg, postmsg,
+            info.prefix * (width - info.nchar)), travel=1)
 
     def _log_end(self, action, msg='', postmsg=' . '):
         """
@@ -342,13 +357,12 @@ class MeshCase(case_core.CaseInfo):
         tarr = self.log.time.setdefault(action, [0,0,0])
         tarr[1] = time.time()
         tarr[2] = tarr[1] - tarr[0]
-        # footer.
-        prefix = info.prefix * (info.width-info.level*info.nchar)
-        info(prefix + '\nEnd %s%s%sElapsed time (sec) = %g' % (
+        # footer; the second call travels upward and thus must stay separate
+        # to be indented at the outer level.
+        width = info.width - info.level*info.nchar
+        info(info.prefix * width + '\nEnd %s%s%sElapsed time (sec) = %g' % (
             action, msg, postmsg, tarr[2]))
-        # up a level.
-        prefix = info.prefix * (info.width-(info.level-1)*info.nchar)
-        info('\n' + prefix + '\n', travel=-1)
+        info('\n' + info.prefix * (width + info.nchar) + '\n', travel=-1)
 
     @property
     def is_parallel(self):
@@ -550,16 +564,16 @@ class MeshCase(case_core.CaseInfo):
                 use_incenter=self.solver.use_incenter)
             self._log_end('convert_genesis_to_block')
         elif '.neu' in meshfn:
-            self._log_start('read_neu_data', msg=' from %s'%meshfn)
+            self._log_start('create_neu_object', msg=' from %s'%meshfn)
+            # feed the stream to the line-based reader instead of slurping
+            # the whole file into a string; peak memory stays at the parsed
+            # structures only.
             if meshfn.endswith('.gz'):
-                stream = gzip.open(meshfn)
+                stream = gzip.open(meshfn, 'rt')
             else:
                 stream = open(meshfn)
-            data = stream.read()
-            stream.close()
-            self._log_end('read_neu_data')
-            self._log_start('create_neu_object')
-            neu = iogambit.GambitNeutral(data)
+            with stream:
+                neu = iogambit.GambitNeutral(stream)
             self._log_end('create_neu_object')
             self._log_start('convert_neu_to_block')
             obj = neu.toblock(bcname_mapper=bcmapper,
@@ -589,7 +603,7 @@ class MeshCase(case_core.CaseInfo):
         >>> str(cse.blk)
         Traceback (most recent call last):
             ...
-        KeyError: 'blk'
+        AttributeError: blk
         >>> cse.init()
         >>> str(cse.blk)
         '[Block (2D/centroid): 4 nodes, 6 faces (3 BC), 3 cells]'
@@ -751,16 +765,26 @@ for node in $nodes; do rsh $node killall %s; done
         dom = self.solver.domainobj
         dealer = self.solver.dealer
         dwidth = len(str(dom.nblk-1))
+        # build the format strings once instead of once per pair.
+        fmt = '%%0%dd' % dwidth
+        arrowfmt = fmt + ' ->'
+        colfmt = ' ' + fmt
+        # assemble the whole banner and emit it with a single info call
+        # instead of one call per pair.
+        lines = []
+        parts = None
         oblk = -1
         for iblk, jblk in dom.ifparr:
             if iblk != oblk:
-                if oblk != -1:
-                    self.info('.\n')
-                self.info(('%%0%dd ->' % dwidth) % iblk)
+                if parts is not None:
+                    lines.append(''.join(parts))
+                parts = [arrowfmt % iblk]
                 oblk = iblk
             dealer.bridge((iblk, jblk))
-            self.info((' %%0%dd'%dwidth) % jblk)
-        self.info('.\n')
+            parts.append(colfmt % jblk)
+        if parts is not None:
+            lines.append(''.join(parts))
+        self.info('.\n'.join(lines) + '.\n')
         dealer.barrier()
 
     # interface.
@@ -777,19 +801,25 @@ for node in $nodes; do rsh $node killall %s; done
         self.info('Interface exchanging pairs (%d phases):\n' % len(
             iflists[0]))
         dwidth = len(str(nblk-1))
+        fmt = '%%0%dd' % dwidth
+        arrowfmt = fmt + ' ->'
+        dash = '-' * (2*dwidth+1)
+        lines = []
         for iblk in range(nblk):
             ifacelist = iflists[iblk]
             sdw = dealer[iblk]
             sdw.cmd.init_exchange(ifacelist)
-            # print.
-            self.info(('%%0%dd ->' % dwidth) % iblk)
+            # assemble the row for this block; the table prints below in
+            # one info call.
+            parts = [arrowfmt % iblk]
             for pair in ifacelist:
                 if pair < 0:
-                    stab = '-' * (2*dwidth+1)
+                    stab = dash
                 else:
-                    stab = '-'.join([('%%0%dd'%dwidth)%item for item in pair])
-                self.info(' %s' % stab)
-            self.info('\n')
+                    stab = '-'.join([fmt%item for item in pair])
+                parts.append(' ' + stab)
+            lines.append(''.join(parts))
+        self.info('\n'.join(lines) + '\n')
 
     def _exchange_metric(self):
         """
@@ -863,11 +893,16 @@ for node in $nodes; do rsh $node killall %s; done
         self._log_start('run_preloop')
         self.runhooks('preloop')
         if flag_parallel:
-            for sdw in dealer: sdw.cmd.preloop()
-            for arrname in self.solver.solvertype._solution_array_:
-                for sdw in dealer:
-                    sdw.cmd.exchangeibc(arrname, with_worker=True)
-            for sdw in dealer: sdw.cmd.apply_bc()
+            # the commands are asynchronous sends processed in order by each
+            # worker, so one pass over the dealer pipelines the whole preloop
+            # sequence instead of sweeping all workers once per command.
+            arrnames = list(self.solver.solvertype._solution_array_)
+            for sdw in dealer:
+                cmd = sdw.cmd
+                cmd.preloop()
+                # all solution arrays ride one message pair per link.
+                cmd.exchangeibc_multi(arrnames, with_worker=True)
+                cmd.apply_bc()
         else:
             self.solver.solverobj.preloop()
             self.solver.solverobj.apply_bc()
@@ -879,33 +914,160 @@ for node in $nodes; do rsh $node killall %s; done
         self.log.time['solver_march'] = 0.0
         self.info('\n')
         self._log_start('run_march')
-        while (self.execution.steps_run is not None and
-               self.execution.step_current < self.execution.steps_run):
-            if self.execution.stop: break
-            # hook: premarch.
-            self.runhooks('premarch')
-            # march.
-            solver_march_marker = time.time()
-            steps_stride = self.execution.steps_stride
-            time_increment = self.execution.time_increment
-            time_current = self.execution.step_current*time_increment
-            if flag_parallel:
-                for sdw in dealer: sdw.cmd.march(
-                    time_current, time_increment, steps_stride,
-                    with_worker=True)
-                self.execution.marchret = [sdw.recv() for sdw in dealer]
+        execution = self.execution
+        premarch = self.runhooks.bind('premarch')
+        postmarch = self.runhooks.bind('postmarch')
+        # accumulate the march timing locally and fold it into the log once
+        # after the loop; perf_counter is monotonic and cheaper than
+        # time.time on Linux.
+        timer = time.perf_counter
+        # dispatch to a loop body specialized to the run mode, so the
+        # serial/parallel branch is decided once here instead of per step.
+        if flag_parallel:
+            # accessing sdw.cmd.march builds a fresh proxy closure each
+            # time; bind it once per worker for the whole run.
+            marches = tuple(sdw.cmd.march for sdw in dealer)
+            if (execution.overlap_hooks and
+                    execution.steps_run is not None and
+                    execution.step_current < execution.steps_run and
+                    not execution.stop):
+                march_seconds = self._march_overlapped(
+                    execution, dealer, marches, premarch, postmarch, timer)
             else:
-                self.execution.marchret = self.solver.solverobj.march(
-                    time_current, time_increment, steps_stride)
-            self.execution.time += time_increment*steps_stride
-            self.log.time['solver_march'] += time.time() - solver_march_marker
-            self.execution.step_current += steps_stride
-            # hook: postmarch.
-            self.runhooks('postmarch')
+                march_seconds = self._march_parallel(
+                    execution, dealer, marches, premarch, postmarch, timer)
+        else:
+            march_seconds = self._march_serial(
+                execution, self.solver.solverobj, premarch, postmarch, timer)
+        self.log.time['solver_march'] += march_seconds
         # end log.
         self._log_end('run_march')
         self.info('\n')
 
+    def _march_parallel(self, execution, dealer, marches, premarch,
+                        postmarch, timer):
+        """
+        March loop body specialized to parallel runs.  The mutable fields
+        (stop, steps_run, strides) are still re-read from the execution node
+        each tick because hooks may change them mid-run.
+
+        :return: seconds spent marching.
+        :rtype: :py:class:`float`
+        """
+        march_seconds = 0.0
+        while (execution.steps_run is not None and
+               execution.step_current < execution.steps_run):
+            if execution.stop: break
+            # hook: premarch.
+            if premarch:
+                for hookfunc in premarch: hookfunc()
+            # march; the step is read once into a local after the hooks
+            # so their mutations are honored.
+            marker = timer()
+            step_current = execution.step_current
+            steps_stride = execution.steps_stride
+            time_increment = execution.time_increment
+            time_current = step_current*time_increment
+            for march in marches: march(
+                time_current, time_increment, steps_stride,
+                with_worker=True)
+            execution.marchret = dealer.gather()
+            step_current += steps_stride
+            # derive time from the step count, exactly like the time the
+            # solver marches on; summing increments drifts over long runs.
+            execution.time = step_current*time_increment
+            march_seconds += timer() - marker
+            execution.step_current = step_current
+            # hook: postmarch.
+            if postmarch:
+                for hookfunc in postmarch: hookfunc()
+        return march_seconds
+
+    def _march_serial(self, execution, solverobj, premarch, postmarch, timer):
+        """
+        March loop body specialized to serial runs; see
+        :py:meth:`_march_parallel`.
+
+        :return: seconds spent marching.
+        :rtype: :py:class:`float`
+        """
+        march_seconds = 0.0
+        while (execution.steps_run is not None and
+               execution.step_current < execution.steps_run):
+            if execution.stop: break
+            # hook: premarch.
+            if premarch:
+                for hookfunc in premarch: hookfunc()
+            # march; the step is read once into a local after the hooks
+            # so their mutations are honored.
+            marker = timer()
+            step_current = execution.step_current
+            steps_stride = execution.steps_stride
+            time_increment = execution.time_increment
+            execution.marchret = solverobj.march(
+                step_current*time_increment, time_increment, steps_stride)
+            step_current += steps_stride
+            # derive time from the step count, exactly like the time the
+            # solver marches on; summing increments drifts over long runs.
+            execution.time = step_current*time_increment
+            march_seconds += timer() - marker
+            execution.step_current = step_current
+            # hook: postmarch.
+            if postmarch:
+                for hookfunc in postmarch: hookfunc()
+        return march_seconds
+
+    def _march_overlapped(self, execution, dealer, marches, premarch,
+                          postmarch, timer):
+        """
+        Pipelined variant of the march loop used when
+        ``execution.overlap_hooks`` is enabled for a parallel run: the next
+        march command is dispatched as soon as the replies of the previous
+        one arrive, so the postmarch and premarch hooks on the head node run
+        while the workers compute.  The marching parameters are sampled at
+        dispatch time; retuning them from hooks mid-run is not honored in
+        this mode.
+
+        :return: seconds spent dispatching and collecting marches.
+        :rtype: :py:class:`float`
+        """
+        march_seconds = 0.0
+        if premarch:
+            for hookfunc in premarch: hookfunc()
+        steps_stride = execution.steps_stride
+        time_increment = execution.time_increment
+        step_current = execution.step_current
+        marker = timer()
+        for march in marches: march(
+            step_current*time_increment, time_increment, steps_stride,
+            with_worker=True)
+        march_seconds += timer() - marker
+        while True:
+            marker = timer()
+            execution.marchret = dealer.gather()
+            march_seconds += timer() - marker
+            step_current += steps_stride
+            execution.time = step_current*time_increment
+            execution.step_current = step_current
+            more = (not execution.stop and
+                    step_current < execution.steps_run)
+            if more:
+                # dispatch the next march before the hooks run, so the
+                # workers compute underneath them.
+                marker = timer()
+                for march in marches: march(
+                    step_current*time_increment, time_increment, steps_stride,
+                    with_worker=True)
+                march_seconds += timer() - marker
+            # the hooks overlap with the outstanding march.
+            if postmarch:
+                for hookfunc in postmarch: hookfunc()
+            if not more:
+                break
+            if premarch:
+                for hookfunc in premarch: hookfunc()
+        return march_seconds
+
     # logics after exiting main loop (march).
     def _run_postloop(self):
         dealer = self.solver.dealer
@@ -935,8 +1097,11 @@ for node in $nodes; do rsh $node killall %s; done
         # finalize.
         self._log_start('run_final')
         if flag_parallel:
-            for sdw in dealer: sdw.cmd.final()
-            dealer.terminate()
+            # final and terminate are asynchronous sends; one pass per
+            # worker lets the whole pool shut down concurrently.
+            for sdw in dealer:
+                sdw.cmd.final()
+                sdw.terminate()
         else:
             self.solver.solverobj.final()
         self._log_end('run_final')
@@ -61,6 +61,26 @@ class _ArrangementRegistry(gendata.SingleAssignDict, gendata.AttributeDict):
 
 arrangements = _ArrangementRegistry()  # overall registry singleton.
 
+_MISSING = object()  # sentinel for single-probe dict lookups.
+
+
+def _parse_keygrp(defdict):
+    """
+    Parse the first hierarchy of a defdict into key groups: a mapping from
+    the first-level key to either a sub-defdict or a leaf value.
+    """
+    keygrp = dict()
+    for key, val in defdict.items():
+        if key is None or key == '':
+            continue
+        tokens = key.split('.', 1)
+        if len(tokens) == 2:
+            fkey, rkey = tokens
+            keygrp.setdefault(fkey, dict())[rkey] = val
+        else:
+            keygrp[tokens[0]] = val
+    return keygrp
+
 
 class CaseInfoMeta(type):
     """
@@ -74,6 +94,12 @@ class CaseInfoMeta(type):
             defdict.update(getattr(base, 'defdict', {}))
         defdict.update(newcls.defdict)
         newcls.defdict = defdict
+        # parse the key groups once per class instead of per instance.
+        newcls._keygrp = _parse_keygrp(defdict)
+        # pair each dotted key with its last token once per class; case
+        # constructors use the pairs to pop matching keywords.
+        newcls._initkeys = tuple(
+            (key, key.rsplit('.', 1)[-1]) for key in defdict)
         # create different simulation registry objects for case classes.
         newcls.arrangements = _ArrangementRegistry()
         return newcls
@@ -92,9 +118,12 @@ class CaseInfo(dict, metaclass=CaseInfoMeta):
         """
         Consult self dictionary for attribute.  It's a shorthand.
         """
-        if name == '__setstate__':
-            raise AttributeError
-        return self[name]
+        try:
+            return dict.__getitem__(self, name)
+        except KeyError:
+            # Raise AttributeError so protocols that probe attributes with
+            # hasattr (e.g. pickle looking for __setstate__) behave.
+            raise AttributeError(name)
 
     def __setattr__(self, name, value):
         """
@@ -103,8 +132,9 @@ class CaseInfo(dict, metaclass=CaseInfoMeta):
         @note: This method is overriden as a stupid-preventer.  It makes
         attribute setting consistent with attribute getting.
         """
-        if name in self:
-            self[name] = value
+        # a single hash probe replaces the containment test plus store.
+        if dict.get(self, name, _MISSING) is not _MISSING:
+            dict.__setitem__(self, name, value)
         else:
             super(CaseInfo, self).__setattr__(name, value)
 
@@ -112,12 +142,14 @@ class CaseInfo(dict, metaclass=CaseInfoMeta):
         """
         Set to self with the dot-separated key.
         """
-        tokens = key.split('.', 1)
-        fkey = tokens[0]
-        if len(tokens) == 2:
-            self[fkey]._set_through(tokens[1], val)
+        # slicing on the located dot avoids the list that split() would
+        # allocate for every level of the recursion.
+        dot = key.find('.')
+        if dot < 0:
+            self[key] = val
         else:
-            self[fkey] = val
+            sub = dict.__getitem__(self, key[:dot])
+            sub._set_through(key[dot+1:], val)
 
     def __init__(self, _defdict=None, *args, **kw):
         """
@@ -127,30 +159,23 @@ class CaseInfo(dict, metaclass=CaseInfoMeta):
         @type _defdict: dict
         """
         super(CaseInfo, self).__init__(*args, **kw)
-        # customize defdict.
+        # determine the key groups: the common case reuses the parse done at
+        # class-creation time; a customized defdict needs a fresh parse.
         if _defdict is None:
-            defdict = self.defdict
+            keygrp = self._keygrp
         else:
             defdict = dict(self.defdict)
             defdict.update(_defdict)
-        # parse first hierarchy to form key groups.
-        keygrp = dict()
-        for key in defdict.keys():
-            if key is None or key == '':
-                continue
-            tokens = key.split('.', 1)
-            if len(tokens) == 2:
-                fkey, rkey = tokens
-                keygrp.setdefault(fkey, dict())[rkey] = defdict[key]
-            else:
-                fkey = tokens[0]
-                keygrp[fkey] = defdict[fkey]
-        # set up first layer keys recursively.
-        for fkey in keygrp.keys():
-            data = keygrp[fkey]
-            if isinstance(data, dict):
+            keygrp = _parse_keygrp(defdict)
+        # set up first layer keys recursively.  The exact-type tests cover
+        # what _parse_keygrp and the defdicts actually produce with a pointer
+        # compare; the isinstance calls remain only as fallback for
+        # subclasses.
+        for fkey, data in keygrp.items():
+            dtype = type(data)
+            if dtype is dict or isinstance(data, dict):
                 self[fkey] = CaseInfo(_defdict=data)
-            elif isinstance(data, type):
+            elif dtype is type or isinstance(data, type):
                 try:
                     self[fkey] = data()
                 except TypeError:
@@ -207,6 +232,20 @@ class HookList(list):
         for hook in runhooks:
             getattr(hook, method)()
 
+    def bind(self, method):
+        """
+        Return the bound methods of every hook for the named event, so hot
+        loops can invoke them without per-call name resolution.
+
+        @param method: name of the method to bind.
+        @type method: str
+        @rtype: tuple
+        """
+        runhooks = self
+        if method == 'postloop':
+            runhooks = reversed(runhooks)
+        return tuple(getattr(hook, method) for hook in runhooks)
+
     def drop_anchor(self, svr):
         for hok in self:
             hok.drop_anchor(svr)
@@ -41,7 +41,6 @@ import sys
 import time
 import traceback
 from numbers import Number
-from io import StringIO
 import signal
 import pickle
 import gzip
@@ -65,6 +64,10 @@ from . import case_core
 # import core.
 from .case_core import arrangements
 
+# compiled code objects for dynamic execution, keyed by source; kept at
+# module level because code objects must not enter the pickled case state.
+_dyn_code_cache = dict()
+
 class BaseCase(case_core.CaseInfo):
     """
     Base class for simulation cases.
@@ -135,14 +138,12 @@ class BaseCase(case_core.CaseInfo):
         tarr = [0,0,0]
         tarr[0] = time.time()
         self.log.time[action] = tarr
-        info(
-            info.prefix * (info.width-info.level*info.nchar),
-            travel=1
-        )
-        info('\nStart %s%s%s' % (action, msg, postmsg))
-        info(
-            '\n' + info.prefix * (info.width-info.level*info.nchar) + '\n',
-        )
+        # compute both banner widths up front; the trailing banner is one
+        # level deeper because the emitting call travels downward.
+        width = info.width - info.level*info.nchar
+        info('%s\nStart %s%s%s\n%s\n' % (
+            info.prefix * width, action, msg, postmsg,
+            info.prefix * (width - info.nchar)), travel=1)
 
     def _log_end(self, action, msg='', postmsg=' . '):
         """
@@ -158,26 +159,21 @@ class BaseCase(case_core.CaseInfo):
         tarr = self.log.time.setdefault(action, [0,0,0])
         tarr[1] = time.time()
         tarr[2] = tarr[1] - tarr[0]
-        info(
-            info.prefix * (info.width-info.level*info.nchar) + \
-            '\nEnd %s%s%sElapsed time (sec) = %g' % (
-                action, msg, postmsg, tarr[2]
-            )
-        )
-        info(
-            '\n' + info.prefix * (info.width-(info.level-1)*info.nchar) + '\n',
-            travel=-1
-        )
+        # footer; the second call travels upward and thus must stay separate
+        # to be indented at the outer level.
+        width = info.width - info.level*info.nchar
+        info(info.prefix * width + '\nEnd %s%s%sElapsed time (sec) = %g' % (
+            action, msg, postmsg, tarr[2]))
+        info('\n' + info.prefix * (width + info.nchar) + '\n', travel=-1)
 
     def __init__(self, **kw):
         """
         Initiailize the basic case.  Set through keyword parameters.
         """
-        # populate value from keywords.
-        initpairs = list()
-        for cinfok in self.defdict.keys():
-            lkey = cinfok.split('.')[-1]
-            initpairs.append((cinfok, kw.pop(lkey, None)))
+        # populate value from keywords; the (dotted key, last token) pairs
+        # are precomputed by CaseInfoMeta.
+        initpairs = [(cinfok, kw.pop(lkey, None))
+                     for cinfok, lkey in self._initkeys]
         # initialize with the left keywords.
         super(BaseCase, self).__init__(**kw)
         # populate value from keywords.
@@ -221,16 +217,20 @@ class BaseCase(case_core.CaseInfo):
                 ))
                 f.write(codes)
                 f.close()
-                # run codes.
-                exec(codes)
+                # run codes; identical snippets reuse the compiled code
+                # object instead of being re-parsed every step.
+                code_obj = _dyn_code_cache.get(codes)
+                if code_obj is None:
+                    code_obj = compile(codes, self.dynamic.inputfn, 'exec')
+                    _dyn_code_cache[codes] = code_obj
+                exec(code_obj)
         except Exception as e:
-            f = StringIO()
-            f.write('\n@@@ dynamic execution at step %d @@@' %
-                self.execution.step_current)
-            f.write('\nCode:\n %s\n' % codes)
-            traceback.print_exc(file=f)
-            self.info(f.getvalue())
-            f.close()
+            self.info(''.join([
+                '\n@@@ dynamic execution at step %d @@@' %
+                    self.execution.step_current,
+                '\nCode:\n %s\n' % codes,
+                traceback.format_exc(),
+            ]))
         # reset preservation flag.
         self.dynamic.preserve = False
 
@@ -261,13 +261,25 @@ class BaseCase(case_core.CaseInfo):
         self.execution.step_current = 0
         self.runhooks('preloop')
         self._log_start('loop_march')
-        while self.execution.step_current < self.execution.steps_run:
-            self.runhooks('premarch')
-            self.execution.marchret = self.solver.solverobj.march(
-                self.execution.step_current*self.execution.time_increment,
-                self.execution.time_increment)
-            self.execution.step_current += 1
-            self.runhooks('postmarch')
+        # hoist the invariant attribute chains; the mutable fields
+        # (steps_run, step_current, time_increment) are still re-read from
+        # the execution node each tick because hooks may change them mid-run.
+        execution = self.execution
+        march = self.solver.solverobj.march
+        premarch = self.runhooks.bind('premarch')
+        postmarch = self.runhooks.bind('postmarch')
+        while execution.step_current < execution.steps_run:
+            if premarch:
+                for hookfunc in premarch: hookfunc()
+            # the step is read once into a local after the hooks so their
+            # mutations are honored.
+            step_current = execution.step_current
+            time_increment = execution.time_increment
+            execution.marchret = march(
+                step_current*time_increment, time_increment)
+            execution.step_current = step_current + 1
+            if postmarch:
+                for hookfunc in postmarch: hookfunc()
         self._log_start('loop_march')
         self.runhooks('postloop')
         # end log.
@@ -358,6 +370,9 @@ class BlockCase(BaseCase):
         'solver.ibcthread': False,
     }
 
+    # unpicklable solver attributes held aside while dumping.
+    _DUMP_HOLD_KEYS = ('mesg',)
+
     def __init__(self, **kw):
         self.pythonpaths = kw.pop('pythonpaths', [])
         super(BlockCase, self).__init__(**kw)
@@ -396,27 +411,37 @@ class BlockCase(BaseCase):
         self.execution.step_restart = self.execution.step_current
         # unbind.
         if flag_parallel:
+            # the dump commands are asynchronous sends; fan all of them out
+            # so the workers write their solvers concurrently, then wait for
+            # every worker to finish before dumping the case itself.
+            basedir = self.io.basedir
+            svrfntmpl = self.io.dump.svrfntmpl
             for iblk in range(len(self.solver.domainobj)):
-                dumpfn = self.io.dump.svrfntmpl % str(iblk)
-                dumpfn = os.path.join(self.io.basedir, dumpfn)
+                dumpfn = os.path.join(basedir, svrfntmpl % str(iblk))
                 dealer[iblk].cmd.dump(dumpfn)
+            dealer.barrier()
         else:
-            self.solver.solverobj.unbind()
-            svrholds = dict()
-            for key in ['mesg',]:
-                svrholds[key] = getattr(self.solver.solverobj, key)
-                setattr(self.solver.solverobj, key, None)
+            solverobj = self.solver.solverobj
+            solverobj.unbind()
+            svrholds = list()
+            for key in self._DUMP_HOLD_KEYS:
+                svrholds.append((key, getattr(solverobj, key)))
+                setattr(solverobj, key, None)
         # pickle.
         self.solver.dealer = None
         dumpfn = os.path.join(self.io.basedir, self.io.dump.csefn)
-        pickle.dump(self, open(dumpfn, 'wb'), pickle.HIGHEST_PROTOCOL)
+        # a wide buffer cuts the write syscalls for large cases, and the
+        # context manager guarantees the file closes even if pickling fails.
+        with open(dumpfn, 'wb', buffering=1<<20) as stream:
+            pickle.Pickler(stream, pickle.HIGHEST_PROTOCOL).dump(self)
         # bind.
         if flag_parallel:
             self.solver.dealer = dealer
         else:
-            for key in svrholds:
-                setattr(self.solver.solverobj, key, svrholds[key])
-            self.solver.solverobj.bind()
+            solverobj = self.solver.solverobj
+            for key, val in svrholds:
+                setattr(solverobj, key, val)
+            solverobj.bind()
 
     def cleanup(self, signum=None, frame=None):
         if self.solver.solverobj != None:
@@ -545,16 +570,16 @@ class BlockCase(BaseCase):
                 use_incenter=self.solver.use_incenter)
             self._log_end('convert_genesis_to_block')
         elif '.neu' in meshfn:
-            self._log_start('read_neu_data', msg=' from %s'%meshfn)
+            self._log_start('create_neu_object', msg=' from %s'%meshfn)
+            # feed the stream to the line-based reader instead of slurping
+            # the whole file into a string; peak memory stays at the parsed
+            # structures only.
             if meshfn.endswith('.gz'):
-                stream = gzip.open(meshfn)
+                stream = gzip.open(meshfn, 'rt')
             else:
                 stream = open(meshfn)
-            data = stream.read()
-            stream.close()
-            self._log_end('read_neu_data')
-            self._log_start('create_neu_object')
-            neu = iogambit.GambitNeutral(data)
+            with stream:
+                neu = iogambit.GambitNeutral(stream)
             self._log_end('create_neu_object')
             self._log_start('convert_neu_to_block')
             obj = neu.toblock(bcname_mapper=bcmapper,
@@ -628,10 +653,13 @@ class BlockCase(BaseCase):
                 dealer[iblk].remote_setattr('muscle', svr)
             self.info('done.\n')
         self.info('Bind/Init ... ')
-        for sdw in dealer: sdw.cmd.bind()
-        for sdw in dealer: sdw.cmd.remote_setattr('ibcthread',
-            self.solver.ibcthread)
-        for sdw in dealer: sdw.cmd.init()
+        # the commands are asynchronous sends, so one pass over the dealer
+        # pipelines all three of them to every worker.
+        ibcthread = self.solver.ibcthread
+        for sdw in dealer:
+            sdw.cmd.bind()
+            sdw.cmd.remote_setattr('ibcthread', ibcthread)
+            sdw.cmd.init()
         dealer.barrier()
         self.info('done.\n')
     def _remote_load_solver(self):
@@ -643,9 +671,10 @@ class BlockCase(BaseCase):
         for iblk in range(nblk):
             dealer[iblk].remote_loadobj('muscle',
                 self.io.dump.svrfntmpl % str(iblk))
-        for sdw in dealer: sdw.cmd.bind()
-        for sdw in dealer: sdw.cmd.remote_setattr('ibcthread',
-            self.solver.ibcthread)
+        ibcthread = self.solver.ibcthread
+        for sdw in dealer:
+            sdw.cmd.bind()
+            sdw.cmd.remote_setattr('ibcthread', ibcthread)
         dealer.barrier()
 
     # workers and worker manager (dealer) creation.
@@ -733,16 +762,26 @@ for node in $nodes; do rsh $node killall %s; done
         dom = self.solver.domainobj
         dealer = self.solver.dealer
         dwidth = len(str(dom.nblk-1))
+        # build the format strings once instead of once per pair.
+        fmt = '%%0%dd' % dwidth
+        arrowfmt = fmt + ' ->'
+        colfmt = ' ' + fmt
+        # assemble the whole banner and emit it with a single info call
+        # instead of one call per pair.
+        lines = []
+        parts = None
         oblk = -1
         for iblk, jblk in dom.ifparr:
             if iblk != oblk:
-                if oblk != -1:
-                    self.info('.\n')
-                self.info(('%%0%dd ->' % dwidth) % iblk)
+                if parts is not None:
+                    lines.append(''.join(parts))
+                parts = [arrowfmt % iblk]
                 oblk = iblk
             dealer.bridge((iblk, jblk))
-            self.info((' %%0%dd'%dwidth) % jblk)
-        self.info('.\n')
+            parts.append(colfmt % jblk)
+        if parts is not None:
+            lines.append(''.join(parts))
+        self.info('.\n'.join(lines) + '.\n')
         dealer.barrier()
 
     # interface.
@@ -759,19 +798,25 @@ for node in $nodes; do rsh $node killall %s; done
         self.info('Interface exchanging pairs (%d phases):\n' % len(
             iflists[0]))
         dwidth = len(str(nblk-1))
+        fmt = '%%0%dd' % dwidth
+        arrowfmt = fmt + ' ->'
+        dash = '-' * (2*dwidth+1)
+        lines = []
         for iblk in range(nblk):
             ifacelist = iflists[iblk]
             sdw = dealer[iblk]
             sdw.cmd.init_exchange(ifacelist)
-            # print.
-            self.info(('%%0%dd ->' % dwidth) % iblk)
+            # assemble the row for this block; the table prints below in
+            # one info call.
+            parts = [arrowfmt % iblk]
             for pair in ifacelist:
                 if isinstance(pair, Number) and pair < 0:
-                    stab = '-' * (2*dwidth+1)
+                    stab = dash
                 else:
-                    stab = '-'.join([('%%0%dd'%dwidth)%item for item in pair])
-                self.info(' %s' % stab)
-            self.info('\n')
+                    stab = '-'.join([fmt%item for item in pair])
+                parts.append(' ' + stab)
+            lines.append(''.join(parts))
+        self.info('\n'.join(lines) + '\n')
 
     def _exchange_metric(self):
         """
@@ -834,11 +879,16 @@ for node in $nodes; do rsh $node killall %s; done
         # hook: preloop.
         self.runhooks('preloop')
         if flag_parallel:
-            for sdw in dealer: sdw.cmd.preloop()
-            for arrname in self.solver.solvertype._solution_array_:
-                for sdw in dealer:
-                    sdw.cmd.exchangeibc(arrname, with_worker=True)
-            for sdw in dealer: sdw.cmd.boundcond()
+            # the commands are asynchronous sends processed in order by each
+            # worker, so one pass over the dealer pipelines the whole preloop
+            # sequence instead of sweeping all workers once per command.
+            arrnames = list(self.solver.solvertype._solution_array_)
+            for sdw in dealer:
+                cmd = sdw.cmd
+                cmd.preloop()
+                # all solution arrays ride one message pair per link.
+                cmd.exchangeibc_multi(arrnames, with_worker=True)
+                cmd.boundcond()
         else:
             self.solver.solverobj.preloop()
             self.solver.solverobj.boundcond()
@@ -849,35 +899,75 @@ for node in $nodes; do rsh $node killall %s; done
         self.log.time['solver_march'] = 0.0
         self.info('\n')
         self._log_start('loop_march')
-        while self.execution.step_current < self.execution.steps_run:
+        # hoist the invariant attribute chains; the mutable fields (stop,
+        # steps_run, strides) are still re-read from the execution node each
+        # tick because hooks and dynamic codes may change them mid-run.
+        execution = self.execution
+        log_time = self.log.time
+        solverobj = self.solver.solverobj
+        premarch = self.runhooks.bind('premarch')
+        postmarch = self.runhooks.bind('postmarch')
+        # accumulate the march timing locally and fold it into the log once
+        # after the loop; perf_counter is monotonic and cheaper than
+        # time.time on Linux.
+        timer = time.perf_counter
+        march_seconds = 0.0
+        # specialize the march callable to the run mode once, so the loop
+        # does not branch on the (run-invariant) parallelism flag per step.
+        if flag_parallel:
+            # accessing sdw.cmd.march builds a fresh proxy closure each
+            # time; bind it once per worker for the whole run.
+            marches = tuple(sdw.cmd.march for sdw in dealer)
+            def march(time_current, time_increment, steps_stride):
+                for worker_march in marches: worker_march(
+                    time_current, time_increment, steps_stride,
+                    with_worker=True)
+                return dealer.gather()
+        else:
+            march = solverobj.march
+        # track the next step at which a dump is due, so the common no-dump
+        # tick compares two integers instead of running a modulo; the
+        # schedule recomputes whenever dynamic codes retune steps_dump.
+        dump_every = None
+        next_dump = None
+        while execution.step_current < execution.steps_run:
             # the first thing is detecting for dynamic codes.
             self._dynamic_execute()
-            if self.execution.stop: break
-            # dump before hooks.
-            if self.execution.steps_dump != None and \
-               self.execution.step_current != self.execution.step_restart and \
-               self.execution.step_current%self.execution.steps_dump == 0:
-                self.dump()
+            if execution.stop: break
+            # dump before hooks; the step is read once into a local for the
+            # predicate.
+            step_current = execution.step_current
+            steps_dump = execution.steps_dump
+            if steps_dump != dump_every:
+                dump_every = steps_dump
+                next_dump = None if dump_every is None else \
+                    -(-step_current//dump_every) * dump_every
+            if next_dump != None and step_current >= next_dump:
+                if step_current == next_dump and \
+                   step_current != execution.step_restart:
+                    self.dump()
+                next_dump = (step_current//dump_every + 1) * dump_every
             # hook: premarch.
-            self.runhooks('premarch')
-            # march.
-            solver_march_marker = time.time()
-            steps_stride = self.execution.steps_stride
-            time_increment = self.execution.time_increment
-            time_current = self.execution.step_current*time_increment
-            if flag_parallel:
-                for sdw in dealer: sdw.cmd.march(
-                    time_current, time_increment, steps_stride,
-                    with_worker=True)
-                self.execution.marchret = [sdw.recv() for sdw in dealer]
-            else:
-                self.execution.marchret = self.solver.solverobj.march(
-                    time_current, time_increment, steps_stride)
-            self.execution.time += time_increment*steps_stride
-            self.log.time['solver_march'] += time.time() - solver_march_marker
-            self.execution.step_current += steps_stride
+            if premarch:
+                for hookfunc in premarch: hookfunc()
+            # march; re-read the step so premarch mutations are honored.
+            solver_march_marker = timer()
+            step_current = execution.step_current
+            steps_stride = execution.steps_stride
+            time_increment = execution.time_increment
+            time_current = step_current*time_increment
+            execution.marchret = march(
+                time_current, time_increment, steps_stride)
+            step_current += steps_stride
+            # derive time from the step count, exactly like the time the
+            # solver marches on; summing increments drifts over long runs.
+            execution.time = step_current*time_increment
+            march_seconds += timer() - solver_march_marker
+            execution.step_current = step_current
             # hook: postmarch.
-            self.runhooks('postmarch')
+            if postmarch:
+                for hookfunc in postmarch: hookfunc()
+        log_time['solver_march'] += march_seconds
         # end log.
         self._log_end('loop_march')
         self.info('\n')
@@ -905,8 +995,11 @@ for node in $nodes; do rsh $node killall %s; done
         flag_parallel = self.is_parallel
         # finalize.
         if flag_parallel:
-            for sdw in dealer: sdw.cmd.final()
-            self.solver.dealer.terminate()
+            # final and terminate are asynchronous sends; one pass per
+            # worker lets the whole pool shut down concurrently.
+            for sdw in dealer:
+                sdw.cmd.final()
+                sdw.terminate()
         else:
             self.solver.solverobj.final()
 
@@ -40,9 +40,6 @@ import optparse
 import socket
 import errno
 
-import boto.ec2
-
-from . import cloud
 from . import helper
 
 from .cmdutil import Command
@@ -87,6 +84,7 @@ class Aws(Command):
         """
         Retrieve settings from :py:class:`AwsHostSetting`.
         """
+        from . import cloud
         def update_kws(dct, src):
             for key in dct:
                 value = getattr(src, key, "")
@@ -112,6 +110,7 @@ class Aws(Command):
 
     @staticmethod
     def run_script(host, name):
+        from . import cloud
         if os.path.isfile(name):
             with open(name) as stream:
                 exec(stream.read())
@@ -157,6 +156,7 @@ class alaunch(Aws):
 
     @staticmethod
     def launch_instance(ops, operator):
+        import boto.ec2
         region = operator.region
         ami = operator.ami
         instkws = dict((key, getattr(operator, key)) for key in 
@@ -185,6 +185,7 @@ class alaunch(Aws):
         return instance
 
     def __call__(self):
+        from . import cloud
         ops, args = self.opargs
 
         operator = self.determine_operator(ops)
@@ -234,6 +235,8 @@ class arun(Aws):
         self.opg_aws_run = opg
 
     def __call__(self):
+        import boto.ec2
+        from . import cloud
         ops, args = self.opargs
         operator = self.determine_operator(ops)
 
@@ -266,6 +269,7 @@ class alist(Aws):
         self.opg_aws_list = opg
 
     def __call__(self):
+        import boto.ec2
         ops, args = self.opargs
         if not ops.region:
             raise ValueError("region is empty")
@@ -317,6 +321,7 @@ class astop(Aws):
         self.opg_aws_stop = opg
 
     def __call__(self):
+        import boto.ec2
         ops, args = self.opargs
 
         conn = boto.ec2.connect_to_region(
@@ -355,6 +360,7 @@ class aterminate(Aws):
         self.opg_aws_stop = opg
 
     def __call__(self):
+        import boto.ec2
         ops, args = self.opargs
 
         conn = boto.ec2.connect_to_region(
@@ -372,7 +372,7 @@ class Collective(Domain, list):
         """
         Split step 4: Build interface BC objects.
         """
-        from numpy import empty, arange, array
+        from numpy import empty, arange, array, unique
         from .boundcond import bctregy
         if interface_type is None:
             interface_type = bctregy.interface
@@ -398,8 +398,12 @@ class Collective(Domain, list):
             neiblk = blk.fccls[leftfcs,2]
             if len(leftfcs) == 0:
                 continue
-            # create BC objects for interfaces.
-            for jblk in range(len(self)):
+            # create BC objects for interfaces; scan only the blocks that
+            # actually neighbor this one instead of all nblk blocks.
+            for jblk in unique(neiblk):
+                jblk = int(jblk)
+                if jblk < 0: # not a block.
+                    continue
                 # take left faces connecting the current block (indexed with
                 # jblk).
                 slct = (neiblk==jblk)
@@ -33,6 +33,11 @@ Helping functionalities.
 """
 
 
+import sys
+
+from . import conf
+
+
 class Printer(object):
     """
     Print message to a stream.
@@ -88,12 +93,14 @@ class Information(object):
     Information logger.
     """
 
-    def __init__(self, prefix='*', nchar=4, width=80, level=0, muted=False):
+    def __init__(self, prefix='*', nchar=4, width=80, level=0, muted=False,
+                 force_flush=True):
         self.prefix = prefix
         self.nchar = nchar
         self.width = width
         self.level = level
         self.muted = muted
+        self.force_flush = force_flush
 
     @property
     def streams(self):
@@ -102,11 +109,9 @@ class Information(object):
 
         List of output streams.
         """
-        import sys
-        from .conf import env
         if self.muted: return []
         streams = [sys.stdout]
-        if env.logfile != None: streams.append(env.logfile)
+        if conf.env.logfile != None: streams.append(conf.env.logfile)
         return streams
 
     def __call__(self, data, travel=0, level=None, has_gap=True):
@@ -129,9 +134,11 @@ class Information(object):
                 prefix += '*'
         prefix = '\n' + prefix*self.level
         data = prefix.join(lines)
+        force_flush = self.force_flush
         for stream in self.streams:
             stream.write(data)
-            stream.flush()
+            if force_flush:
+                stream.flush()
 info = Information()
 
 def generate_apidoc(outputdir='doc/api'):
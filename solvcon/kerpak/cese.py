@@ -663,8 +663,8 @@ class CflHook(Hook):
         self.hnCFL = hnCFL if not isnan(hnCFL) else self.hnCFL
         hxCFL = max([xCFL, self.hxCFL])
         self.hxCFL = hxCFL if not isnan(hxCFL) else self.hxCFL
-        self.aCFL += xCFL*steps_stride
-        self.mCFL = self.aCFL/(istep+steps_stride)
+        self.mCFL += (xCFL-self.mCFL)*steps_stride/(istep+steps_stride)
+        self.aCFL = self.mCFL*(istep+steps_stride)
         self.aadj += aadj
         self.haadj += aadj
         # check.
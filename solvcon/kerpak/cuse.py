@@ -915,8 +915,8 @@ class CflHook(Hook):
             self.hnCFL = hnCFL if not isnan(hnCFL) else self.hnCFL
             hxCFL = max([xCFL, self.hxCFL])
             self.hxCFL = hxCFL if not isnan(hxCFL) else self.hxCFL
-            self.aCFL += xCFL*rsteps
-            self.mCFL = self.aCFL/istep
+            self.mCFL += (xCFL-self.mCFL)*rsteps/istep
+            self.aCFL = self.mCFL*istep
             self.aadj += aadj
             self.haadj += aadj
             # check.
@@ -287,8 +287,8 @@ class CflHook(sc.MeshHook):
             self.hnCFL = hnCFL if not np.isnan(hnCFL) else self.hnCFL
             hxCFL = max([xCFL, self.hxCFL])
             self.hxCFL = hxCFL if not np.isnan(hxCFL) else self.hxCFL
-            self.aCFL += xCFL*rsteps
-            self.mCFL = self.aCFL/istep
+            self.mCFL += (xCFL-self.mCFL)*rsteps/istep
+            self.aCFL = self.mCFL*istep
             self.aadj += aadj
             self.haadj += aadj
             # check.
@@ -33,7 +33,9 @@ Remote procedure call and inter-process communication.
 """
 
 
-import sys, os
+import sys
+import os
+import pickle
 
 
 DEFAULT_AUTHKEY = b'solvcon.rpc'
@@ -255,7 +257,6 @@ class Worker(object):
         sys.stderr = self.stderr_orig
 
     def chdir(self, dirname):
-        import os
         os.chdir(dirname)
 
     def remote_setattr(self, name, var):
@@ -268,8 +269,7 @@ class Worker(object):
         """
         Remotely unpickle a file and set it to self with the specified name.
         """
-        import cPickle as pickle
-        setattr(self, name, pickle.load(open(objfn)))
+        setattr(self, name, pickle.load(open(objfn, 'rb')))
 
     def barrier(self):
         """
@@ -450,7 +450,6 @@ class Dealer(list):
     WAIT_FOR_ACCEPT = 0.1
 
     def __init__(self, *args, **kw):
-        import sys
         self.publicaddress = kw.pop('publicaddress', None)
         self.authkey = kw.pop('authkey', DEFAULT_AUTHKEY)
         self.family = kw.pop('family', None)
@@ -561,12 +560,43 @@ class Dealer(list):
         @param msg: message to output after temination.
         @type msg: str
         """
-        import sys
         for sdw in self[idx]:
             sdw.terminate()
         if msg:
             sys.stdout.write(msg)
 
+    def gather(self, idx=slice(None,None,None)):
+        """
+        Collect one reply from every worker.  Replies are drained in the
+        order they become ready instead of blocking on the workers in list
+        order, so one slow worker does not hold up the replies already
+        sitting in the other pipes.
+
+        @param idx: what to collect from.
+        @type idx: slice or list
+        @return: replies ordered as the workers.
+        @rtype: list
+        """
+        from multiprocessing.connection import wait
+        shadows = self[idx]
+        replies = [None] * len(shadows)
+        pending = dict()
+        for it, sdw in enumerate(shadows):
+            handle = getattr(sdw.conn, 'conn', None)
+            if handle is None:  # not waitable, e.g., MPI connection.
+                pending = None
+                break
+            pending[handle] = it
+        if pending is None: # fall back to in-order blocking receives.
+            for it, sdw in enumerate(shadows):
+                replies[it] = sdw.recv()
+        else:
+            while pending:
+                for handle in wait(list(pending)):
+                    it = pending.pop(handle)
+                    replies[it] = shadows[it].recv()
+        return replies
+
     def barrier(self, idx=slice(None,None,None), msg=None):
         """
         Check for barrier signals sent from workers.  Used for synchronization.
@@ -576,11 +606,11 @@ class Dealer(list):
         @param msg: message to output after synchronization.
         @type msg: str
         """
-        import sys
         for sdw in self[idx]:
             sdw.barrier()
-        for sdw in self[idx]:
-            assert issubclass(sdw.recv(), Barrier)
+        # drain the acknowledgements in readiness order, like gather().
+        for obj in self.gather(idx=idx):
+            assert issubclass(obj, Barrier)
         if msg:
             sys.stdout.write(msg)
 
@@ -673,7 +703,6 @@ class SecureShell(object):
         @keywork envar: additional environment variables to remote.
         @type envar: dict
         """
-        import sys
         from subprocess import Popen
         script = self.prescript + script
         # build the commands to be run remotely.
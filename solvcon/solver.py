@@ -36,6 +36,7 @@ Definition of the structure of solvers.
 import os
 import time
 import itertools
+from numbers import Number
 
 import numpy as np
 
@@ -517,6 +518,85 @@ class MeshSolver(metaclass=MeshSolverMeta):
             # call to data transfer.
             target(*args, **kwargs)
 
+    def exchangeibc_multi(self, arrnames, worker=None):
+        """
+        :param arrnames: The names of the arrays in the object to exchange.
+        :type arrnames: sequence
+        :keyword worker: The wrapping worker object for parallel processing.
+            Default is None.
+        :type worker: solvcon.rpc.Worker
+
+        Exchange several arrays with one message pair per interface link,
+        instead of one full pass over the links per array.
+        """
+        for ibc in self.ibclist:
+            # check if sleep or not.
+            if isinstance(ibc, Number) and ibc < 0:
+                continue
+            bc, sendn, recvn = ibc
+            # call to data transfer.
+            if self.svrn == sendn:
+                self.pushibc_multi(arrnames, bc, recvn, worker=worker)
+            elif self.svrn == recvn:
+                self.pullibc_multi(arrnames, bc, sendn, worker=worker)
+            else:
+                raise ValueError('bc.rblkn = %d != %d or %d' % (
+                    bc.rblkn, sendn, recvn))
+
+    def pushibc_multi(self, arrnames, bc, recvn, worker=None):
+        """
+        :param arrnames: The names of the arrays in the object to exchange.
+        :type arrnames: sequence
+        :param bc: The interface BC to push.
+        :type bc: solvcon.boundcond.interface
+        :param recvn: Serial number of the peer to exchange data with.
+        :type recvn: int
+        :keyword worker: The wrapping worker object for parallel processing.
+            Default is None.
+        :type worker: solvcon.rpc.Worker
+
+        As :py:meth:`pushibc`, but all the named arrays travel in a single
+        message pair over the link.
+        """
+        conn = worker.pconns[bc.rblkn]
+        ngstcell = self.ngstcell
+        arrs = [getattr(self, arrname) for arrname in arrnames]
+        # ask the receiver for data.
+        rarrs = conn.recv() # comm.
+        slct = bc.rclp[:,0] + ngstcell
+        for arr, rarr in zip(arrs, rarrs):
+            arr[slct] = rarr[:]
+        # provide the receiver with data.
+        slct = bc.rclp[:,2] + ngstcell
+        conn.send([arr[slct] for arr in arrs])  # comm.
+
+    def pullibc_multi(self, arrnames, bc, sendn, worker=None):
+        """
+        :param arrnames: The names of the arrays in the object to exchange.
+        :type arrnames: sequence
+        :param bc: The interface BC to pull.
+        :type bc: solvcon.boundcond.interface
+        :param sendn: Serial number of the peer to exchange data with.
+        :type sendn: int
+        :keyword worker: The wrapping worker object for parallel processing.
+            Default is None.
+        :type worker: solvcon.rpc.Worker
+
+        As :py:meth:`pullibc`, but all the named arrays travel in a single
+        message pair over the link.
+        """
+        conn = worker.pconns[bc.rblkn]
+        ngstcell = self.ngstcell
+        arrs = [getattr(self, arrname) for arrname in arrnames]
+        # provide sender the data.
+        slct = bc.rclp[:,2] + ngstcell
+        conn.send([arr[slct] for arr in arrs])  # comm.
+        # ask data from sender.
+        rarrs = conn.recv() # comm.
+        slct = bc.rclp[:,0] + ngstcell
+        for arr, rarr in zip(arrs, rarrs):
+            arr[slct] = rarr[:]
+
     def pushibc(self, arrname, bc, recvn, worker=None):
         """
         :param arrname: The name of the array in the object to exchange.
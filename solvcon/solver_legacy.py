@@ -35,6 +35,7 @@ Definition of the structure of solvers.
 
 from numbers import Number
 from ctypes import Structure
+from time import perf_counter as _timer
 
 from .gendata import TypeWithBinder
 from .solver_core import ALMOST_ZERO
@@ -316,33 +317,32 @@ class BaseSolver(metaclass=TypeWithBinder):
         @return: arbitrary return value.
         @rtype: float
         """
-        from time import time as _time
         self.marchret = dict()
         self.step_current = 0
         self.runanchors('premarch')
         while self.step_current < steps_run:
             self.substep_current = 0
             self.runanchors('prefull')
-            t0= _time()
+            t0= _timer()
             while self.substep_current < self.substep_run:
                 self._set_time(time, time_increment)
                 self.runanchors('presub')
                 # run marching methods.
                 for mmname in self.mmnames:
                     method = getattr(self, mmname)
-                    t1 = _time()
+                    t1 = _timer()
                     self.runanchors('pre'+mmname)
-                    t2 = _time()
+                    t2 = _timer()
                     method(worker=worker)
-                    self.timer.increase(mmname, _time() - t2)
+                    self.timer.increase(mmname, _timer() - t2)
                     self.runanchors('post'+mmname)
-                    self.timer.increase(mmname+'_a', _time() - t1)
+                    self.timer.increase(mmname+'_a', _timer() - t1)
                 # increment time.
                 time += time_increment/self.substep_run
                 self._set_time(time, time_increment)
                 self.substep_current += 1
                 self.runanchors('postsub')
-            self.timer.increase('march', _time() - t0)
+            self.timer.increase('march', _timer() - t0)
             self.step_global += 1
             self.step_current += 1
             self.runanchors('postfull')
@@ -670,6 +670,100 @@ class BlockSolver(BaseSolver):
             for thread in threads:
                 thread.join()
 
+    def exchangeibc_multi(self, arrnames, worker=None):
+        """
+        Exchange several arrays with one message pair per interface link,
+        instead of one full pass over the links per array.
+
+        @param arrnames: names of the arrays in the object to exchange.
+        @type arrnames: sequence
+        @keyword worker: the wrapping worker object for parallel processing.
+        @type worker: solvcon.rpc.Worker
+        """
+        from threading import Thread
+        threads = list()
+        for ibc in self.ibclist:
+            # check if sleep or not.
+            if isinstance(ibc, Number) and ibc < 0:
+                continue
+            bc, sendn, recvn = ibc
+            # determine callable and arguments.
+            if self.svrn == sendn:
+                target = self.pushibc_multi
+                args = arrnames, bc, recvn
+            elif self.svrn == recvn:
+                target = self.pullibc_multi
+                args = arrnames, bc, sendn
+            else:
+                raise ValueError('bc.rblkn = %d != %d or %d' % (
+                    bc.rblkn, sendn, recvn))
+            kwargs = {'worker': worker}
+            # call to data transfer.
+            if self.ibcthread:
+                threads.append(Thread(
+                    target=target,
+                    args=args,
+                    kwargs=kwargs,
+                ))
+                threads[-1].start()
+            else:
+                target(*args, **kwargs)
+        if self.ibcthread:
+            for thread in threads:
+                thread.join()
+
+    def pushibc_multi(self, arrnames, bc, recvn, worker=None):
+        """
+        As pushibc(), but all the named arrays travel in a single message
+        pair over the link.
+
+        @param arrnames: names of the arrays in the object to exchange.
+        @type arrnames: sequence
+        @param bc: the interface BC to push.
+        @type bc: solvcon.boundcond.interface
+        @param recvn: serial number of the peer to exchange data with.
+        @type recvn: int
+        @keyword worker: the wrapping worker object for parallel processing.
+        @type worker: solvcon.rpc.Worker
+        """
+        conn = worker.pconns[bc.rblkn]
+        ngstcell = self.ngstcell
+        arrs = [getattr(self, arrname) for arrname in arrnames]
+        # ask the receiver for data.
+        rarrs = conn.recv() # comm.
+        slct = bc.rclp[:,0] + ngstcell
+        for arr, rarr in zip(arrs, rarrs):
+            arr[slct] = rarr[:]
+        # provide the receiver with data.
+        slct = bc.rclp[:,2] + ngstcell
+        conn.send([arr[slct] for arr in arrs])  # comm.
+
+    def pullibc_multi(self, arrnames, bc, sendn, worker=None):
+        """
+        As pullibc(), but all the named arrays travel in a single message
+        pair over the link.
+
+        @param arrnames: names of the arrays in the object to exchange.
+        @type arrnames: sequence
+        @param bc: the interface BC to pull.
+        @type bc: solvcon.boundcond.interface
+        @param sendn: serial number of the peer to exchange data with.
+        @type sendn: int
+        @keyword worker: the wrapping worker object for parallel processing.
+        @type worker: solvcon.rpc.Worker
+        """
+        conn = worker.pconns[bc.rblkn]
+        ngstcell = self.ngstcell
+        arrs = [getattr(self, arrname) for arrname in arrnames]
+        # provide sender the data.
+        slct = bc.rclp[:,2] + ngstcell
+        conn.send([arr[slct] for arr in arrs])  # comm.
+        # ask data from sender.
+        rarrs = conn.recv() # comm.
+        slct = bc.rclp[:,0] + ngstcell
+        for arr, rarr in zip(arrs, rarrs):
+            arr[slct] = rarr[:]
+
     def pushibc(self, arrname, bc, recvn, worker=None):
         """
         Push data toward selected interface which connect to blocks with larger
@@ -29,10 +29,21 @@
 # POSSIBILITY OF SUCH DAMAGE.
 
 
+import sys
+import subprocess
 import unittest
 import importlib
 
 
+class TestLazyMarch(unittest.TestCase):
+    def test_march_not_loaded_at_import(self):
+        # The march extension must load only on first attribute access,
+        # never as a side effect of importing the package.
+        code = ("import sys, solvcon; "
+                "assert 'libmarch' not in sys.modules")
+        subprocess.check_call([sys.executable, '-c', code])
+
+
 class TestAllImport(unittest.TestCase):
     def test_everything(self):
         allmods = [